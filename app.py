@@ -8,18 +8,24 @@ import asyncio
 import json
 import logging
 import os
+import time
 import uuid
+from collections import deque
+from contextlib import asynccontextmanager
+from itertools import islice
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Deque, Dict, List, Optional
 from dataclasses import dataclass, asdict
 from pathlib import Path
-import base64
+import hashlib
 
 # FastAPI and WebSocket imports
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import HTMLResponse, FileResponse
+from fastapi.responses import HTMLResponse, FileResponse, ORJSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.middleware.cors import CORSMiddleware
+import orjson
 import uvicorn
 
 # Browser-use imports
@@ -31,6 +37,37 @@ import playwright.async_api as playwright
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Live-view screenshot settings
+SCREENSHOT_QUALITY = int(os.getenv("SCREENSHOT_QUALITY", 60))
+VIEWPORT_SIZE = {"width": 1024, "height": 768}
+SCREENSHOT_CLIP = {"x": 0, "y": 0, **VIEWPORT_SIZE}
+MAX_CONCURRENT_SCREENSHOTS = int(os.getenv("MAX_CONCURRENT_SCREENSHOTS", 8))
+
+# Idle browser contexts kept around for reuse by new sessions
+CONTEXT_POOL_SIZE = int(os.getenv("CONTEXT_POOL_SIZE", 4))
+
+# Appended to browser-use's system prompt. It must stay identical across
+# sessions and steps: per-session details belong in the task so the system
+# prefix can be served from the prompt cache.
+AGENT_SYSTEM_EXTENSION = (
+    "You are running inside the Reputable browser-use web UI. "
+    "Operators watch your browser live, so keep each action purposeful "
+    "and report a concise result when the task is done."
+)
+
+# Log retention per session
+MAX_SESSION_LOGS = 200
+
+# Messages produced within this window reach each client as one batch
+MESSAGE_BATCH_WINDOW = 0.05
+
+# Clients that can't accept a frame within this many seconds are dropped
+SEND_TIMEOUT = 2.0
+
+async def send_json(websocket: WebSocket, message: dict):
+    """Send a JSON text frame, serialised with orjson"""
+    await websocket.send_text(orjson.dumps(message).decode())
+
 @dataclass
 class BrowserSession:
     """Represents an active browser automation session"""
@@ -42,28 +79,78 @@ class BrowserSession:
     status: str = "idle"  # idle, running, completed, error
     task: str = ""
     created_at: datetime = None
-    logs: List[dict] = None
+    logs: Deque[dict] = None
+    last_screenshot: Optional[bytes] = None  # Latest frame, replayed to new viewers
+    last_screenshot_meta: Optional[dict] = None
+    screenshot_task: Optional[asyncio.Task] = None
+    update_event: Optional[asyncio.Event] = None
     
     def __post_init__(self):
         if self.created_at is None:
             self.created_at = datetime.now()
         if self.logs is None:
-            self.logs = []
+            self.logs = deque(maxlen=MAX_SESSION_LOGS)
+        if self.update_event is None:
+            self.update_event = asyncio.Event()
+    
+    def notify_update(self):
+        """Wake every WebSocket waiting for this session's next state change"""
+        # Swap in a fresh event so each waiter sees exactly one wake-up
+        event, self.update_event = self.update_event, asyncio.Event()
+        event.set()
+    
+    async def stop_screenshots(self):
+        """Cancel the screenshot loop and wait for it to exit"""
+        if self.screenshot_task:
+            self.screenshot_task.cancel()
+            await asyncio.gather(self.screenshot_task, return_exceptions=True)
+            self.screenshot_task = None
     
     def to_dict(self):
         return {
             "session_id": self.session_id,
             "status": self.status,
             "task": self.task,
-            "created_at": self.created_at.isoformat(),
-            "logs": self.logs[-50:]  # Last 50 log entries
+            "created_at": self.created_at,
+            "logs": list(islice(self.logs, max(0, len(self.logs) - 50), None))  # Last 50 log entries
         }
 
+@dataclass(eq=False)
+class ClientConnection:
+    """A dashboard WebSocket watching a session"""
+    websocket: WebSocket
+    frames: asyncio.Queue = None  # Holds at most the latest unsent screenshot
+    relay_task: Optional[asyncio.Task] = None
+    dropped_frames: int = 0
+    pending: List[dict] = None  # Messages waiting for the next batch
+    flush_task: Optional[asyncio.Task] = None
+    
+    def __post_init__(self):
+        if self.frames is None:
+            self.frames = asyncio.Queue(maxsize=1)
+        if self.pending is None:
+            self.pending = []
+    
+    def offer_frame(self, meta: dict, frame: bytes):
+        """Queue a screenshot, replacing any frame the client hasn't received yet"""
+        if self.frames.full():
+            self.frames.get_nowait()
+            self.dropped_frames += 1
+        self.frames.put_nowait((meta, frame))
+
 class BrowserUseWebUI:
     def __init__(self):
-        self.app = FastAPI(title="Browser-Use Web UI", version="1.0.0")
+        self.app = FastAPI(
+            title="Browser-Use Web UI",
+            version="1.0.0",
+            default_response_class=ORJSONResponse,
+            lifespan=self.lifespan
+        )
         self.sessions: Dict[str, BrowserSession] = {}
-        self.active_connections: Dict[str, WebSocket] = {}
+        self._sessions_lock = asyncio.Lock()
+        self.active_connections: Dict[str, List[ClientConnection]] = {}
+        self._connections_lock = asyncio.Lock()
+        self._screenshot_semaphore = asyncio.Semaphore(MAX_CONCURRENT_SCREENSHOTS)
         
         # Setup CORS
         self.app.add_middleware(
@@ -73,6 +160,7 @@ class BrowserUseWebUI:
             allow_methods=["*"],
             allow_headers=["*"],
         )
+        self.app.add_middleware(GZipMiddleware, minimum_size=500)
         
         # Setup static files
         static_path = Path(__file__).parent / "static"
@@ -82,17 +170,62 @@ class BrowserUseWebUI:
         # Setup routes
         self.setup_routes()
         
-        # Initialize playwright instance
+        # Serve the dashboard (static/index.html) at the root. Mounted after the
+        # routes so it doesn't shadow them; StaticFiles handles ETag and 304s.
+        self.app.mount("/", StaticFiles(directory=static_path, html=True), name="dashboard")
+        
+        # Shared clients, created once in lifespan()
         self.playwright_instance = None
+        self.browser = None
+        self.anthropic_client = None
+        self._context_pool: asyncio.Queue = asyncio.Queue(maxsize=CONTEXT_POOL_SIZE)
+    
+    @asynccontextmanager
+    async def lifespan(self, app: FastAPI):
+        """Start the shared browser and LLM client, and release them on shutdown"""
+        self.anthropic_client = Anthropic(api_key=os.getenv("ANTHROPIC_API_KEY"))
+        self.playwright_instance = await playwright.async_playwright().start()
+        self.browser = await self.playwright_instance.chromium.launch(headless=True)
+        logger.info("Shared Chromium browser launched")
+        
+        try:
+            yield
+        finally:
+            try:
+                await self.browser.close()
+            except Exception as e:
+                logger.error(f"Error closing browser: {e}")
+            await self.playwright_instance.stop()
+            self.anthropic_client.close()
+    
+    async def acquire_context(self):
+        """Take an idle browser context from the pool, or create one"""
+        try:
+            return self._context_pool.get_nowait()
+        except asyncio.QueueEmpty:
+            return await self.browser.new_context(viewport=VIEWPORT_SIZE)
+    
+    async def release_context(self, browser_context):
+        """Reset a browser context and return it to the pool, closing it if the pool is full"""
+        try:
+            for page in list(browser_context.pages):
+                await page.close()
+            await browser_context.clear_cookies()
+            await browser_context.clear_permissions()
+            self._context_pool.put_nowait(browser_context)
+        except asyncio.QueueFull:
+            await browser_context.close()
+        except Exception as e:
+            # Contexts that can't be reset are discarded
+            logger.error(f"Error recycling browser context: {e}")
+            try:
+                await browser_context.close()
+            except Exception:
+                pass
         
     def setup_routes(self):
         """Setup all API routes"""
         
-        @self.app.get("/")
-        async def dashboard():
-            """Serve the main dashboard"""
-            return HTMLResponse(self.get_dashboard_html())
-        
         @self.app.get("/health")
         async def health_check():
             """Health check endpoint for Railway"""
@@ -101,9 +234,10 @@ class BrowserUseWebUI:
         @self.app.get("/api/sessions")
         async def list_sessions():
             """List all browser sessions"""
+            sessions_snapshot = list(self.sessions.values())
             return {
-                "sessions": [session.to_dict() for session in self.sessions.values()],
-                "total": len(self.sessions)
+                "sessions": [session.to_dict() for session in sessions_snapshot],
+                "total": len(sessions_snapshot)
             }
         
         @self.app.post("/api/sessions")
@@ -119,7 +253,8 @@ class BrowserUseWebUI:
                 task=task
             )
             
-            self.sessions[session_id] = session
+            async with self._sessions_lock:
+                self.sessions[session_id] = session
             logger.info(f"Created session {session_id} for task: {task}")
             
             return {"session_id": session_id, "status": "created"}
@@ -142,12 +277,15 @@ class BrowserUseWebUI:
         @self.app.delete("/api/sessions/{session_id}")
         async def stop_session(session_id: str):
             """Stop and delete a session"""
-            if session_id not in self.sessions:
+            # Unregister first so concurrent requests can't clean up twice
+            async with self._sessions_lock:
+                session = self.sessions.pop(session_id, None)
+            if session is None:
                 raise HTTPException(status_code=404, detail="Session not found")
-            
-            session = self.sessions[session_id]
+            session.notify_update()
             
             # Clean up browser resources
+            await session.stop_screenshots()
             if session.page:
                 try:
                     await session.page.close()
@@ -155,12 +293,8 @@ class BrowserUseWebUI:
                     pass
             
             if session.browser:
-                try:
-                    await session.browser.close()
-                except:
-                    pass
-            
-            del self.sessions[session_id]
+                browser_context, session.browser = session.browser, None
+                await self.release_context(browser_context)
             
             return {"message": "Session stopped and deleted"}
         
@@ -168,39 +302,71 @@ class BrowserUseWebUI:
         async def websocket_endpoint(websocket: WebSocket, session_id: str):
             """WebSocket for real-time session updates"""
             await websocket.accept()
-            self.active_connections[session_id] = websocket
+            connection = ClientConnection(websocket=websocket)
+            connection.relay_task = asyncio.create_task(
+                self._relay_screenshots(session_id, connection)
+            )
+            async with self._connections_lock:
+                self.active_connections.setdefault(session_id, []).append(connection)
+            
+            # Show the current frame right away instead of waiting for a change
+            session = self.sessions.get(session_id)
+            if session and session.last_screenshot:
+                connection.offer_frame(session.last_screenshot_meta, session.last_screenshot)
             
             try:
                 while True:
-                    # Keep connection alive and send periodic updates
-                    if session_id in self.sessions:
-                        session = self.sessions[session_id]
-                        await websocket.send_json({
-                            "type": "status_update",
-                            "data": session.to_dict()
-                        })
+                    session = self.sessions.get(session_id)
+                    if session is None:
+                        await websocket.close()
+                        break
+                    
+                    # Grab the event before sending so no update is missed
+                    update_event = session.update_event
+                    sent = await self._safe_send(session_id, connection, {
+                        "type": "status_update",
+                        "data": session.to_dict()
+                    })
+                    if not sent:
+                        break
                     
-                    await asyncio.sleep(1)  # Send updates every second
+                    # Push only on state changes, with a keepalive when idle
+                    while sent:
+                        try:
+                            await asyncio.wait_for(update_event.wait(), timeout=30)
+                            break
+                        except asyncio.TimeoutError:
+                            sent = await self._safe_send(session_id, connection, {"type": "ping"})
+                    if not sent:
+                        break
+                    
+                    # Fold a burst of changes into a single status update
+                    await asyncio.sleep(MESSAGE_BATCH_WINDOW)
                     
             except WebSocketDisconnect:
-                if session_id in self.active_connections:
-                    del self.active_connections[session_id]
+                pass
+            finally:
+                connection.relay_task.cancel()
+                if connection.flush_task:
+                    connection.flush_task.cancel()
+                await self._remove_connections(session_id, [connection])
+                if connection.dropped_frames:
+                    logger.info(
+                        f"Viewer of session {session_id} skipped "
+                        f"{connection.dropped_frames} stale screenshots"
+                    )
     
     async def _run_browser_automation(self, session_id: str):
         """Run browser automation for a session"""
         session = self.sessions[session_id]
         session.status = "running"
+        session.notify_update()
         
         try:
             await self._log_to_session(session_id, "info", "Starting browser automation...")
             
-            # Initialize Anthropic client
-            anthropic_client = Anthropic(api_key=os.getenv("ANTHROPIC_API_KEY"))
-            
-            # Initialize playwright browser directly
-            playwright_instance = await playwright.async_playwright().start()
-            browser = await playwright_instance.chromium.launch(headless=True)
-            browser_context = await browser.new_context()
+            # Isolate the session in its own (possibly recycled) browser context
+            browser_context = await self.acquire_context()
             session.browser = browser_context
             
             # Create a new page
@@ -215,7 +381,8 @@ class BrowserUseWebUI:
             # Create browser-use agent
             agent = Agent(
                 task=session.task,
-                llm=anthropic_client
+                llm=self.anthropic_client,
+                extend_system_message=AGENT_SYSTEM_EXTENSION
             )
             session.agent = agent
             
@@ -223,49 +390,69 @@ class BrowserUseWebUI:
             
             # Set up real-time monitoring
             async def capture_screenshots():
-                """Capture screenshots periodically"""
-                while session.status == "running":
+                """Capture screenshots periodically until cancelled"""
+                last_hash: Optional[bytes] = None
+                while True:
                     try:
                         if session.page:
-                            screenshot = await session.page.screenshot(type="png")
-                            screenshot_b64 = base64.b64encode(screenshot).decode()
+                            # Bound how many sessions capture at once
+                            async with self._screenshot_semaphore:
+                                screenshot = await session.page.screenshot(
+                                    type="jpeg",
+                                    quality=SCREENSHOT_QUALITY,
+                                    clip=SCREENSHOT_CLIP
+                                )
                             
-                            # Send screenshot to connected clients
-                            if session_id in self.active_connections:
-                                await self.active_connections[session_id].send_json({
-                                    "type": "screenshot",
+                            # Skip sending when the page hasn't changed
+                            screenshot_hash = hashlib.blake2b(screenshot, digest_size=16).digest()
+                            if screenshot_hash != last_hash:
+                                last_hash = screenshot_hash
+                                session.last_screenshot = screenshot
+                                session.last_screenshot_meta = {
+                                    "type": "screenshot_meta",
                                     "data": {
-                                        "image": screenshot_b64,
-                                        "timestamp": datetime.now().isoformat()
+                                        "timestamp": time.time()
                                     }
-                                })
+                                }
+                                
+                                # Hand the frame to each viewer's relay task
+                                for connection in list(self.active_connections.get(session_id, [])):
+                                    connection.offer_frame(session.last_screenshot_meta, screenshot)
                     except Exception as e:
                         logger.error(f"Screenshot capture error: {e}")
                     
                     await asyncio.sleep(2)  # Screenshot every 2 seconds
             
-            # Start screenshot capture in background
-            asyncio.create_task(capture_screenshots())
+            # Start screenshot capture in background, replacing any earlier loop
+            await session.stop_screenshots()
+            session.screenshot_task = asyncio.create_task(capture_screenshots())
             
             # Run the automation
             result = await agent.run()
             
             session.status = "completed"
+            session.notify_update()
             await self._log_to_session(session_id, "success", f"Task completed: {result}")
             
         except Exception as e:
             session.status = "error"
+            session.notify_update()
             error_msg = f"Error in browser automation: {str(e)}"
             logger.error(error_msg)
             await self._log_to_session(session_id, "error", error_msg)
         
         finally:
             # Clean up
+            await session.stop_screenshots()
             if session.page:
                 try:
                     await session.page.close()
                 except:
                     pass
+            
+            if session.browser:
+                browser_context, session.browser = session.browser, None
+                await self.release_context(browser_context)
     
     async def _log_to_session(self, session_id: str, level: str, message: str):
         """Add a log entry to a session and broadcast it"""
@@ -273,316 +460,79 @@ class BrowserUseWebUI:
             return
         
         log_entry = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": time.time(),  # Epoch seconds, formatted by the dashboard
             "level": level,
             "message": message
         }
         
-        self.sessions[session_id].logs.append(log_entry)
+        session = self.sessions[session_id]
+        session.logs.append(log_entry)
+        session.notify_update()
         
         # Broadcast to connected WebSocket clients
-        if session_id in self.active_connections:
+        self._broadcast(session_id, {
+            "type": "log",
+            "data": log_entry
+        })
+    
+    def _broadcast(self, session_id: str, message: dict):
+        """Queue a message for every client watching a session"""
+        for connection in list(self.active_connections.get(session_id, [])):
+            connection.pending.append(message)
+            if connection.flush_task is None or connection.flush_task.done():
+                connection.flush_task = asyncio.create_task(
+                    self._flush_messages(session_id, connection)
+                )
+    
+    async def _flush_messages(self, session_id: str, connection: ClientConnection):
+        """Send a client's queued messages as batches until its queue is empty"""
+        while connection.pending:
+            await asyncio.sleep(MESSAGE_BATCH_WINDOW)
+            items, connection.pending = connection.pending, []
+            if not await self._safe_send(session_id, connection, {"type": "batch", "items": items}):
+                return
+    
+    async def _relay_screenshots(self, session_id: str, connection: ClientConnection):
+        """Forward queued screenshots to a single client at its own pace"""
+        while True:
+            meta, frame = await connection.frames.get()
+            if not await self._safe_send(session_id, connection, meta, frame):
+                return
+    
+    async def _safe_send(
+        self,
+        session_id: str,
+        connection: ClientConnection,
+        message: Optional[dict] = None,
+        data: Optional[bytes] = None
+    ) -> bool:
+        """Send a JSON message and/or binary frame, dropping the client on failure"""
+        try:
+            if message is not None:
+                await asyncio.wait_for(send_json(connection.websocket, message), SEND_TIMEOUT)
+            if data is not None:
+                await asyncio.wait_for(connection.websocket.send_bytes(data), SEND_TIMEOUT)
+            return True
+        except Exception:
+            # The client disconnected or isn't draining its socket
             try:
-                await self.active_connections[session_id].send_json({
-                    "type": "log",
-                    "data": log_entry
-                })
-            except:
-                pass  # Connection might be closed
+                await connection.websocket.close(code=1011)
+            except Exception:
+                pass
+            await self._remove_connections(session_id, [connection])
+            return False
     
-    def get_dashboard_html(self):
-        """Generate the dashboard HTML"""
-        return """
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Browser-Use Web UI - Reputable Platform</title>
-    <script src="https://cdn.tailwindcss.com"></script>
-    <script src="https://unpkg.com/vue@3/dist/vue.global.js"></script>
-    <style>
-        [v-cloak] { display: none; }
-        .log-entry { font-family: 'Courier New', monospace; }
-        .screenshot-container { max-height: 400px; overflow: auto; }
-    </style>
-</head>
-<body class="bg-gray-100">
-    <div id="app" v-cloak class="container mx-auto p-4">
-        <header class="bg-white rounded-lg shadow-md p-6 mb-6">
-            <div class="flex justify-between items-center">
-                <div>
-                    <h1 class="text-3xl font-bold text-gray-800">Browser-Use Web UI</h1>
-                    <p class="text-gray-600">Real-time monitoring of browser automation agents</p>
-                </div>
-                <div class="flex items-center space-x-4">
-                    <div class="bg-green-100 text-green-800 px-3 py-1 rounded-full text-sm">
-                        {{ sessions.length }} Sessions
-                    </div>
-                    <button @click="showCreateDialog = true" 
-                            class="bg-blue-600 text-white px-4 py-2 rounded-lg hover:bg-blue-700 transition-colors">
-                        New Session
-                    </button>
-                </div>
-            </div>
-        </header>
-
-        <!-- Create Session Dialog -->
-        <div v-if="showCreateDialog" class="fixed inset-0 bg-black bg-opacity-50 flex items-center justify-center z-50">
-            <div class="bg-white rounded-lg p-6 w-full max-w-md">
-                <h3 class="text-xl font-bold mb-4">Create New Session</h3>
-                <div class="mb-4">
-                    <label class="block text-sm font-medium text-gray-700 mb-2">Task Description</label>
-                    <textarea v-model="newSessionTask" 
-                              class="w-full border border-gray-300 rounded-lg p-3 h-24"
-                              placeholder="Describe what you want the browser agent to do..."></textarea>
-                </div>
-                <div class="flex justify-end space-x-3">
-                    <button @click="showCreateDialog = false" 
-                            class="px-4 py-2 text-gray-600 hover:text-gray-800">Cancel</button>
-                    <button @click="createSession" 
-                            class="px-4 py-2 bg-blue-600 text-white rounded-lg hover:bg-blue-700">Create</button>
-                </div>
-            </div>
-        </div>
-
-        <!-- Sessions Grid -->
-        <div class="grid grid-cols-1 lg:grid-cols-2 xl:grid-cols-3 gap-6">
-            <div v-for="session in sessions" :key="session.session_id" 
-                 class="bg-white rounded-lg shadow-md overflow-hidden">
-                
-                <!-- Session Header -->
-                <div class="bg-gray-50 px-4 py-3 border-b">
-                    <div class="flex justify-between items-center">
-                        <h3 class="font-semibold text-gray-800 truncate">
-                            {{ session.task || 'Untitled Session' }}
-                        </h3>
-                        <span :class="getStatusClass(session.status)" 
-                              class="px-2 py-1 rounded-full text-xs font-medium">
-                            {{ session.status }}
-                        </span>
-                    </div>
-                    <p class="text-xs text-gray-500 mt-1">
-                        {{ formatTime(session.created_at) }}
-                    </p>
-                </div>
-
-                <!-- Screenshot Display -->
-                <div v-if="screenshots[session.session_id]" class="screenshot-container p-4 bg-gray-900">
-                    <img :src="'data:image/png;base64,' + screenshots[session.session_id]" 
-                         class="w-full h-auto rounded border" 
-                         alt="Live Screenshot">
-                    <p class="text-xs text-gray-400 mt-2 text-center">Live View</p>
-                </div>
-
-                <!-- Session Logs -->
-                <div class="p-4">
-                    <h4 class="font-medium text-gray-700 mb-2">Recent Logs</h4>
-                    <div class="bg-gray-900 text-green-400 rounded p-3 h-32 overflow-y-auto">
-                        <div v-for="log in session.logs.slice(-10)" :key="log.timestamp" 
-                             class="log-entry text-xs mb-1">
-                            <span class="text-gray-500">{{ formatLogTime(log.timestamp) }}</span>
-                            <span :class="getLogLevelClass(log.level)" class="font-medium">
-                                [{{ log.level.toUpperCase() }}]
-                            </span>
-                            {{ log.message }}
-                        </div>
-                        <div v-if="session.logs.length === 0" class="text-gray-500 text-center">
-                            No logs yet...
-                        </div>
-                    </div>
-                </div>
-
-                <!-- Session Actions -->
-                <div class="px-4 pb-4 flex justify-between">
-                    <button v-if="session.status === 'idle'" 
-                            @click="startSession(session.session_id)"
-                            class="bg-green-600 text-white px-3 py-1 rounded text-sm hover:bg-green-700">
-                        Start
-                    </button>
-                    <button v-if="session.status === 'running'" 
-                            @click="stopSession(session.session_id)"
-                            class="bg-red-600 text-white px-3 py-1 rounded text-sm hover:bg-red-700">
-                        Stop
-                    </button>
-                    <button @click="deleteSession(session.session_id)"
-                            class="bg-gray-600 text-white px-3 py-1 rounded text-sm hover:bg-gray-700">
-                        Delete
-                    </button>
-                </div>
-            </div>
-
-            <!-- Empty State -->
-            <div v-if="sessions.length === 0" class="col-span-full text-center py-12">
-                <div class="text-gray-400">
-                    <svg class="mx-auto h-12 w-12 mb-4" fill="none" viewBox="0 0 24 24" stroke="currentColor">
-                        <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" 
-                              d="M9.75 17L9 20l-1 1h8l-1-1-.75-3M3 13h18M5 17h14a2 2 0 002-2V5a2 2 0 00-2-2H5a2 2 0 00-2 2v10a2 2 0 002 2z" />
-                    </svg>
-                    <h3 class="text-lg font-medium text-gray-500 mb-2">No active sessions</h3>
-                    <p class="text-gray-400 mb-4">Create your first browser automation session</p>
-                    <button @click="showCreateDialog = true" 
-                            class="bg-blue-600 text-white px-4 py-2 rounded-lg hover:bg-blue-700">
-                        Create Session
-                    </button>
-                </div>
-            </div>
-        </div>
-    </div>
-
-    <script>
-        const { createApp } = Vue;
-
-        createApp({
-            data() {
-                return {
-                    sessions: [],
-                    screenshots: {},
-                    websockets: {},
-                    showCreateDialog: false,
-                    newSessionTask: '',
-                    isLoading: false
-                }
-            },
-            mounted() {
-                this.loadSessions();
-                setInterval(this.loadSessions, 5000); // Refresh every 5 seconds
-            },
-            methods: {
-                async loadSessions() {
-                    try {
-                        const response = await fetch('/api/sessions');
-                        const data = await response.json();
-                        this.sessions = data.sessions;
-                        
-                        // Setup WebSocket connections for active sessions
-                        for (const session of this.sessions) {
-                            if (!this.websockets[session.session_id] && session.status === 'running') {
-                                this.setupWebSocket(session.session_id);
-                            }
-                        }
-                    } catch (error) {
-                        console.error('Failed to load sessions:', error);
-                    }
-                },
-                
-                async createSession() {
-                    if (!this.newSessionTask.trim()) return;
-                    
-                    this.isLoading = true;
-                    try {
-                        const response = await fetch('/api/sessions', {
-                            method: 'POST',
-                            headers: { 'Content-Type': 'application/json' },
-                            body: JSON.stringify({ task: this.newSessionTask })
-                        });
-                        
-                        if (response.ok) {
-                            this.showCreateDialog = false;
-                            this.newSessionTask = '';
-                            await this.loadSessions();
-                        }
-                    } catch (error) {
-                        console.error('Failed to create session:', error);
-                    } finally {
-                        this.isLoading = false;
-                    }
-                },
-                
-                async startSession(sessionId) {
-                    try {
-                        await fetch(`/api/sessions/${sessionId}/start`, { method: 'POST' });
-                        await this.loadSessions();
-                        this.setupWebSocket(sessionId);
-                    } catch (error) {
-                        console.error('Failed to start session:', error);
-                    }
-                },
-                
-                async stopSession(sessionId) {
-                    try {
-                        await fetch(`/api/sessions/${sessionId}`, { method: 'DELETE' });
-                        await this.loadSessions();
-                        if (this.websockets[sessionId]) {
-                            this.websockets[sessionId].close();
-                            delete this.websockets[sessionId];
-                        }
-                    } catch (error) {
-                        console.error('Failed to stop session:', error);
-                    }
-                },
-                
-                async deleteSession(sessionId) {
-                    if (!confirm('Are you sure you want to delete this session?')) return;
-                    await this.stopSession(sessionId);
-                },
-                
-                setupWebSocket(sessionId) {
-                    const protocol = window.location.protocol === 'https:' ? 'wss:' : 'ws:';
-                    const wsUrl = `${protocol}//${window.location.host}/ws/${sessionId}`;
-                    
-                    const ws = new WebSocket(wsUrl);
-                    
-                    ws.onmessage = (event) => {
-                        const message = JSON.parse(event.data);
-                        
-                        if (message.type === 'screenshot') {
-                            this.screenshots[sessionId] = message.data.image;
-                        } else if (message.type === 'log') {
-                            // Update session logs in real-time
-                            const session = this.sessions.find(s => s.session_id === sessionId);
-                            if (session) {
-                                session.logs.push(message.data);
-                            }
-                        } else if (message.type === 'status_update') {
-                            // Update session status
-                            const sessionIndex = this.sessions.findIndex(s => s.session_id === sessionId);
-                            if (sessionIndex !== -1) {
-                                this.sessions[sessionIndex] = message.data;
-                            }
-                        }
-                    };
-                    
-                    ws.onclose = () => {
-                        delete this.websockets[sessionId];
-                    };
-                    
-                    this.websockets[sessionId] = ws;
-                },
-                
-                getStatusClass(status) {
-                    const classes = {
-                        idle: 'bg-gray-100 text-gray-800',
-                        running: 'bg-blue-100 text-blue-800',
-                        completed: 'bg-green-100 text-green-800',
-                        error: 'bg-red-100 text-red-800'
-                    };
-                    return classes[status] || classes.idle;
-                },
-                
-                getLogLevelClass(level) {
-                    const classes = {
-                        info: 'text-blue-400',
-                        success: 'text-green-400',
-                        error: 'text-red-400',
-                        warning: 'text-yellow-400'
-                    };
-                    return classes[level] || classes.info;
-                },
-                
-                formatTime(timestamp) {
-                    return new Date(timestamp).toLocaleString();
-                },
-                
-                formatLogTime(timestamp) {
-                    return new Date(timestamp).toLocaleTimeString();
-                }
-            }
-        }).mount('#app');
-    </script>
-</body>
-</html>
-        """
+    async def _remove_connections(self, session_id: str, removed: List[ClientConnection]):
+        """Unregister WebSocket clients from a session"""
+        async with self._connections_lock:
+            connections = self.active_connections.get(session_id)
+            if connections is None:
+                return
+            for connection in removed:
+                if connection in connections:
+                    connections.remove(connection)
+            if not connections:
+                del self.active_connections[session_id]
 
 # Global app instance
 web_ui = BrowserUseWebUI()
@@ -594,6 +544,13 @@ if __name__ == "__main__":
         "app:app",
         host="0.0.0.0",
         port=port,
-        reload=True,
+        loop="uvloop",
+        http="httptools",
+        ws="websockets",
+        ws_per_message_deflate=True,
+        ws_ping_interval=10,
+        ws_ping_timeout=10,
+        ws_max_size=2**20,
+        reload=False,
         log_level="info"
     )
\ No newline at end of file